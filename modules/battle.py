@@ -38,7 +38,6 @@ from modules.pokemon import (
     get_type_by_name,
 )
 from modules.tasks import get_global_script_context, get_task, get_tasks, task_is_active
-from modules.tcg_card import generate_tcg_card
 
 
 class BattleOutcome(Enum):
@@ -525,6 +524,8 @@ class BattleOpponent:
         else:
             for i, party_member in enumerate(get_party()):
                 if party_member.is_shiny and party_member != before_party_list[i]:
+                    from modules.tcg_card import generate_tcg_card
+
                     generate_tcg_card(party_member, location=f"Evolved at {get_player_avatar().map_location.map_name}")
                     break
             self.action = None
@@ -36,6 +36,7 @@ class Config:
         self.catch_block: CatchBlock = CatchBlock()
         self.cheats: Cheats = Cheats()
         self.discord: Discord = Discord()
+        self.file_modification_times: dict[Path, int] = {}
         self.is_profile = is_profile
         self.keys: Keys = Keys()
         self.loaded = False
@@ -77,6 +78,8 @@ class Config:
     def reload_file(self, attr: str, strict: bool = False) -> None:
         """Reload a specific configuration file, using the same source.
 
+        Files that have not been modified since they were last loaded are skipped.
+
         :param attr: The instance attribute that holds the config file to load.
         :param strict: Whether all files must be present in the directory.
         """
@@ -85,8 +88,16 @@ class Config:
         if not isinstance(config_inst, BaseConfig):
             raise exceptions.PrettyValueError(f"Config.{attr} is not a valid configuration to load.")
         file_path = self.config_dir / config_inst.filename
+        try:
+            modification_time = file_path.stat().st_mtime_ns
+        except OSError:
+            modification_time = None
+        if modification_time is not None and self.file_modification_times.get(file_path) == modification_time:
+            return
         if config_inst := load_config_file(file_path, config_inst.__class__, strict=strict):
             setattr(self, attr, config_inst)
+            if modification_time is not None:
+                self.file_modification_times[file_path] = modification_time
 
     def save_file(self, attr: str, strict: bool = False) -> None:
         """Save a specific configuration file, using the same source.
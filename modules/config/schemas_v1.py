@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Literal
 
 from confz import BaseConfig
-from pydantic import ConfigDict, Field, field_validator
+from pydantic import ConfigDict, Field, field_serializer, field_validator
 from pydantic.types import Annotated, ClassVar, NonNegativeInt, PositiveInt
 
 
@@ -77,7 +77,12 @@ class CatchBlock(BaseConfig):
     """Schema for the catch_block configuration."""
 
     filename: ClassVar = "catch_block.yml"
-    block_list: list[str] = []
+    block_list: frozenset[str] = frozenset()
+
+    @field_serializer("block_list")
+    def serialize_block_list(self, value: frozenset[str]) -> list[str]:
+        """Store the block list as a plain YAML list."""
+        return sorted(value)
 
 
 class Cheats(BaseConfig):
@@ -1,17 +1,17 @@
 from enum import Enum, auto
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable
 
 from modules.console import console
 from modules.context import context
 from modules.files import save_pk3, make_string_safe_for_file_name
-from modules.gui.desktop_notification import desktop_notification
 from modules.memory import get_game_state, GameState
 from modules.modes import BattleAction
 from modules.pokedex import get_pokedex
 from modules.pokemon import Pokemon
 from modules.roamer import get_roamer
 from modules.runtime import get_sprites_path
-from modules.tcg_card import generate_tcg_card
 
 
 def shiny_encounter_gif() -> Path | None:
@@ -30,10 +30,32 @@ def shiny_encounter_gif() -> Path | None:
     return None
 
 
-def run_custom_catch_filters(pokemon: Pokemon) -> str | bool:
+@lru_cache(maxsize=2048)
+def _notification_icon_path(species_name: str, is_shiny: bool) -> Path:
+    return get_sprites_path() / "pokemon" / ("shiny" if is_shiny else "normal") / f"{species_name}.png"
+
+
+_custom_catch_filters: Callable[[Pokemon], str | bool] | None = None
+
+
+def load_custom_catch_filters() -> None:
+    """
+    Looks up the profile's custom catch filters (which means loading the stats module and
+    importing `customcatchfilters.py`.) This is called when the bot starts so that this work
+    does not delay handling the first encounter.
+    """
+    global _custom_catch_filters
+
     from modules.stats import total_stats
 
-    result = total_stats.custom_catch_filters(pokemon)
+    _custom_catch_filters = total_stats.custom_catch_filters
+
+
+def run_custom_catch_filters(pokemon: Pokemon) -> str | bool:
+    if _custom_catch_filters is None:
+        load_custom_catch_filters()
+
+    result = _custom_catch_filters(pokemon)
     if result is True:
         result = "Matched a custom catch filter"
     return result
@@ -52,24 +74,85 @@ class EncounterValue(Enum):
         return self in (EncounterValue.Shiny, EncounterValue.Roamer, EncounterValue.CustomFilterMatch)
 
 
-def judge_encounter(pokemon: Pokemon) -> EncounterValue:
+# How `handle_encounter()` reacts to each kind of encounter: The console message, the desktop
+# notification (title, message) and the `logging.save_pk3` setting that decides whether to save
+# a PK3 file. `{species}` and `{filter_result}` are replaced when the message is shown.
+_ENCOUNTER_REACTIONS: dict[EncounterValue, tuple[str | None, tuple[str, str] | None, str | None]] = {
+    EncounterValue.Shiny: (
+        "[bold yellow]Shiny {species} found![/]",
+        ("Shiny found!", "Found a ✨shiny {species}✨! 🥳"),
+        "shiny",
+    ),
+    EncounterValue.CustomFilterMatch: (
+        "[pink green]Custom filter triggered for {species}: '{filter_result}'[/]",
+        ("Custom filter triggered!", "Found a {species} that matched one of your filters."),
+        "custom",
+    ),
+    EncounterValue.Roamer: (
+        "[pink yellow]Roaming {species} found![/]",
+        ("Roaming Pokémon found!", "Encountered a roaming {species}."),
+        "roamer",
+    ),
+    EncounterValue.ShinyOnBlockList: (
+        "[bold yellow]{species} is on the catch block list, skipping encounter...[/]",
+        None,
+        "shiny",
+    ),
+    EncounterValue.RoamerOnBlockList: (
+        "[bold yellow]{species} is on the catch block list, skipping encounter...[/]",
+        None,
+        None,
+    ),
+    EncounterValue.Trash: (None, None, None),
+}
+
+# The same encounter usually gets judged several times in a row (by the bot mode, then by
+# `handle_encounter()`, ...) so the classification of the most recently seen Pokémon (shiny,
+# roamer, custom filter match or none of these) is kept here, keyed by personality value and
+# species. The catch block list is not part of it and gets checked on every call, so that edits
+# to it take effect straight away.
+_last_judged_pokemon: tuple[int, int] | None = None
+_last_classification: EncounterValue | None = None
+
+
+def judge_encounter(pokemon: Pokemon, custom_filter_result: str | bool | None = None) -> EncounterValue:
     """
     Checks whether an encountered Pokémon matches any of the criteria that makes it
     eligible for catching (is shiny, matches custom catch filter, ...)
 
     :param pokemon: The Pokémon that has been encountered.
+    :param custom_filter_result: Result of `run_custom_catch_filters()` for this Pokémon, if the
+                                 caller has already run them. Otherwise they will be run here.
     :return: The perceived 'value' of the encounter.
     """
+    global _last_judged_pokemon, _last_classification
 
-    if pokemon.is_shiny:
+    key = (pokemon.personality_value, pokemon.species.index)
+    if key == _last_judged_pokemon and _last_classification is not None:
+        classification = _last_classification
+    else:
+        classification = _classify_encounter(pokemon, custom_filter_result)
+        _last_judged_pokemon, _last_classification = key, classification
+
+    if classification in (EncounterValue.Shiny, EncounterValue.Roamer):
         context.config.reload_file("catch_block")
         block_list = context.config.catch_block.block_list
-        if pokemon.species_name_for_stats in block_list or pokemon.species.name in block_list:
-            return EncounterValue.ShinyOnBlockList
-        else:
-            return EncounterValue.Shiny
+        if not block_list.isdisjoint((pokemon.species_name_for_stats, pokemon.species.name)):
+            if classification is EncounterValue.Shiny:
+                return EncounterValue.ShinyOnBlockList
+            else:
+                return EncounterValue.RoamerOnBlockList
+
+    return classification
+
+
+def _classify_encounter(pokemon: Pokemon, custom_filter_result: str | bool | None) -> EncounterValue:
+    if pokemon.is_shiny:
+        return EncounterValue.Shiny
 
-    if run_custom_catch_filters(pokemon) is not False:
+    if custom_filter_result is None:
+        custom_filter_result = run_custom_catch_filters(pokemon)
+    if custom_filter_result is not False:
         return EncounterValue.CustomFilterMatch
 
     roamer = get_roamer()
@@ -78,46 +161,47 @@ def judge_encounter(pokemon: Pokemon) -> EncounterValue:
         and roamer.personality_value == pokemon.personality_value
         and roamer.species == pokemon.species
     ):
-        context.config.reload_file("catch_block")
-        block_list = context.config.catch_block.block_list
-        if pokemon.species_name_for_stats in block_list or pokemon.species.name in block_list:
-            return EncounterValue.RoamerOnBlockList
-        else:
-            return EncounterValue.Roamer
+        return EncounterValue.Roamer
 
     return EncounterValue.Trash
 
 
 def log_encounter(
-    pokemon: Pokemon, action: BattleAction | None = None, gif_path: Path | None = None, tcg_path: Path | None = None
+    pokemon: Pokemon,
+    action: BattleAction | None = None,
+    gif_path: Path | None = None,
+    tcg_path: Path | None = None,
+    custom_filter_result: str | bool | None = None,
 ) -> None:
     from modules.stats import total_stats
 
-    total_stats.log_encounter(
-        pokemon, context.config.catch_block.block_list, run_custom_catch_filters(pokemon), gif_path, tcg_path
-    )
+    if custom_filter_result is None:
+        custom_filter_result = run_custom_catch_filters(pokemon)
+
+    total_stats.log_encounter(pokemon, context.config.catch_block.block_list, custom_filter_result, gif_path, tcg_path)
     if context.config.logging.save_pk3.all:
         save_pk3(pokemon)
 
-    fun_facts = [
+    species_name = pokemon.species.name
+    held_item = pokemon.held_item
+    fun_facts = (
         f"Nature:\xa0{pokemon.nature.name}",
         f"Ability:\xa0{pokemon.ability.name}",
-        f"Item:\xa0{pokemon.held_item.name if pokemon.held_item is not None else '-'}",
+        f"Item:\xa0{held_item.name if held_item is not None else '-'}",
         f"IV\xa0sum:\xa0{pokemon.ivs.sum()}",
         f"SV:\xa0{pokemon.shiny_value:,}",
-    ]
+    )
 
-    species_name = pokemon.species.name
-    if pokemon.is_shiny:
-        species_name = f"Shiny {species_name}"
-    if pokemon.gender == "male":
-        species_name += " ♂"
-    elif pokemon.gender == "female":
-        species_name += " ♀"
-    if pokemon.species.name == "Unown":
-        species_name += f" ({pokemon.unown_letter})"
-    if pokemon.species.name == "Wurmple":
-        fun_facts.append(f"Evo: {pokemon.wurmple_evolution.title()}")
+    display_name = f"Shiny {species_name}" if pokemon.is_shiny else species_name
+    gender = pokemon.gender
+    if gender == "male":
+        display_name += " ♂"
+    elif gender == "female":
+        display_name += " ♀"
+    if species_name == "Unown":
+        display_name += f" ({pokemon.unown_letter})"
+    elif species_name == "Wurmple":
+        fun_facts += (f"Evo: {pokemon.wurmple_evolution.title()}",)
 
     match action:
         case BattleAction.Catch:
@@ -131,7 +215,7 @@ def log_encounter(
         case _:
             message_action = "."
 
-    context.message = f"Encountered {species_name}{message_action}\n\n{' | '.join(fun_facts)}"
+    context.message = f"Encountered {display_name}{message_action}\n\n{' | '.join(fun_facts)}"
 
 
 def handle_encounter(
@@ -140,62 +224,37 @@ def handle_encounter(
     disable_auto_battle: bool = False,
     do_not_log_battle_action: bool = False,
 ) -> BattleAction:
-    encounter_value = judge_encounter(pokemon)
+    custom_filter_result = run_custom_catch_filters(pokemon)
+    encounter_value = judge_encounter(pokemon, custom_filter_result)
+    console_message, alert, save_pk3_setting = _ENCOUNTER_REACTIONS[encounter_value]
+    is_of_interest = encounter_value.is_of_interest
+    species_name = pokemon.species.name
+
+    if console_message is not None:
+        console.print(console_message.format(species=species_name, filter_result=custom_filter_result))
+
     gif_path, tcg_path = None, None
-    match encounter_value:
-        case EncounterValue.Shiny:
-            console.print(f"[bold yellow]Shiny {pokemon.species.name} found![/]")
-            alert = "Shiny found!", f"Found a ✨shiny {pokemon.species.name}✨! 🥳"
-            gif_path = shiny_encounter_gif()
-            tcg_path = generate_tcg_card(pokemon)
-            if not context.config.logging.save_pk3.all and context.config.logging.save_pk3.shiny:
-                save_pk3(pokemon)
-            is_of_interest = True
-
-        case EncounterValue.CustomFilterMatch:
-            filter_result = run_custom_catch_filters(pokemon)
-            console.print(f"[pink green]Custom filter triggered for {pokemon.species.name}: '{filter_result}'[/]")
-            alert = "Custom filter triggered!", f"Found a {pokemon.species.name} that matched one of your filters."
-            if not context.config.logging.save_pk3.all and context.config.logging.save_pk3.custom:
-                save_pk3(pokemon)
-            is_of_interest = True
-
-        case EncounterValue.Roamer:
-            console.print(f"[pink yellow]Roaming {pokemon.species.name} found![/]")
-            alert = "Roaming Pokémon found!", f"Encountered a roaming {pokemon.species.name}."
-            # If this is the first time the Roamer is encountered
-            if pokemon.species not in get_pokedex().seen_species and (
-                not context.config.logging.save_pk3.all and context.config.logging.save_pk3.roamer
-            ):
-                save_pk3(pokemon)
-            is_of_interest = True
-
-        case EncounterValue.ShinyOnBlockList:
-            console.print(f"[bold yellow]{pokemon.species.name} is on the catch block list, skipping encounter...[/]")
-            alert = None
-            gif_path = shiny_encounter_gif()
-            tcg_path = generate_tcg_card(pokemon)
-            if not context.config.logging.save_pk3.all and context.config.logging.save_pk3.shiny:
-                save_pk3(pokemon)
-            is_of_interest = False
-
-        case EncounterValue.RoamerOnBlockList:
-            console.print(f"[bold yellow]{pokemon.species.name} is on the catch block list, skipping encounter...[/]")
-            alert = None
-            is_of_interest = False
-
-        case EncounterValue.Trash | _:
-            alert = None
-            is_of_interest = False
+    if encounter_value in (EncounterValue.Shiny, EncounterValue.ShinyOnBlockList):
+        from modules.tcg_card import generate_tcg_card
+
+        gif_path = shiny_encounter_gif()
+        tcg_path = generate_tcg_card(pokemon)
+
+    # With `save_pk3.all` enabled, `log_encounter()` saves the file already. Roamers are only
+    # saved the first time they are encountered.
+    if (
+        save_pk3_setting is not None
+        and not context.config.logging.save_pk3.all
+        and getattr(context.config.logging.save_pk3, save_pk3_setting)
+        and (encounter_value is not EncounterValue.Roamer or pokemon.species not in get_pokedex().seen_species)
+    ):
+        save_pk3(pokemon)
 
     if alert is not None:
-        alert_icon = (
-            get_sprites_path()
-            / "pokemon"
-            / f"{'shiny' if pokemon.is_shiny else 'normal'}"
-            / f"{pokemon.species.name}.png"
-        )
-        desktop_notification(title=alert[0], message=alert[1], icon=alert_icon)
+        from modules.gui.desktop_notification import desktop_notification
+
+        alert_icon = _notification_icon_path(species_name, pokemon.is_shiny)
+        desktop_notification(title=alert[0], message=alert[1].format(species=species_name), icon=alert_icon)
 
     battle_is_active = get_game_state() in (GameState.BATTLE, GameState.BATTLE_STARTING, GameState.BATTLE_ENDING)
 
@@ -214,8 +273,8 @@ def handle_encounter(
         decision = BattleAction.RunAway
 
     if do_not_log_battle_action or not battle_is_active:
-        log_encounter(pokemon, None, gif_path, tcg_path)
+        log_encounter(pokemon, None, gif_path, tcg_path, custom_filter_result)
     else:
-        log_encounter(pokemon, decision, gif_path, tcg_path)
+        log_encounter(pokemon, decision, gif_path, tcg_path, custom_filter_result)
 
     return decision
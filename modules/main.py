@@ -4,6 +4,7 @@ from threading import Thread
 
 from modules.console import console
 from modules.context import context
+from modules.encounter import load_custom_catch_filters
 from modules.memory import GameState, get_game_state
 from modules.modes import BotListener, BotMode, BotModeError, FrameInfo, get_bot_listeners, get_bot_mode_by_name
 from modules.tasks import get_global_script_context, get_tasks
@@ -22,6 +23,8 @@ def main_loop() -> None:
     try:
         current_mode: BotMode | None = None
 
+        load_custom_catch_filters()
+
         if context.config.discord.rich_presence:
             from modules.discord import discord_rich_presence
 
@@ -8,7 +8,7 @@ from modules.map_data import MapFRLG, MapRSE
 from modules.map_path import calculate_path
 from modules.menuing import PokemonPartyMenuNavigator, StartMenuNavigator
 from modules.player import get_player_avatar
-from modules.pokemon import get_party, Pokemon
+from modules.pokemon import get_party, get_party_size, Pokemon
 from modules.save_data import get_save_data
 from ._asserts import (
     assert_save_game_exists,
@@ -29,38 +29,66 @@ from .util import (
     wait_until_task_is_not_active,
 )
 
+# Gift encounters keyed by (map group, map number, x, y) of the tile the player needs to face.
+_FRLG_ENCOUNTERS: dict[tuple[int, int, int, int], tuple[MapFRLG, tuple[int, int], str]] = {
+    (*entry[0].value, *entry[1]): entry
+    for entry in (
+        (MapFRLG.SILPH_CO_7F, (0, 7), "Lapras"),
+        (MapFRLG.SAFFRON_CITY_DOJO, (5, 3), "Hitmonlee"),
+        (MapFRLG.SAFFRON_CITY_DOJO, (7, 3), "Hitmonchan"),
+        (MapFRLG.CINNABAR_ISLAND_POKEMON_LAB_EXPERIMENT_ROOM, (11, 2), "Kanto Fossils"),
+        (MapFRLG.CINNABAR_ISLAND_POKEMON_LAB_EXPERIMENT_ROOM, (13, 4), "Kanto Fossils"),
+        (MapFRLG.CELADON_CITY_CONDOMINIUMS_ROOF_ROOM, (7, 3), "Eevee"),
+        (MapFRLG.ROUTE4_POKEMON_CENTER_1F, (1, 3), "Magikarp"),
+        (MapFRLG.FIVE_ISLAND_WATER_LABYRINTH, (14, 11), "Togepi"),
+    )
+}
+_RSE_ENCOUNTERS: dict[tuple[int, int, int, int], tuple[MapRSE, tuple[int, int], str]] = {
+    (*entry[0].value, *entry[1]): entry
+    for entry in (
+        (MapRSE.ROUTE119_WEATHER_INSTITUTE_2F, (2, 2), "Castform"),
+        (MapRSE.ROUTE119_WEATHER_INSTITUTE_2F, (18, 6), "Castform"),
+        (MapRSE.RUSTBORO_CITY_DEVON_CORP_2F, (14, 8), "Hoenn Fossils"),
+        (MapRSE.MOSSDEEP_CITY_STEVENS_HOUSE, (4, 3), "Beldum"),
+        (MapRSE.LAVARIDGE_TOWN, (4, 7), "Wynaut"),
+    )
+}
+
+# Gifts that have to be accepted in a Yes/No prompt before they are handed over.
+_GIFTS_REQUIRING_CONFIRMATION = frozenset({"Beldum", "Hitmonchan", "Hitmonlee", "Magikarp", "Wynaut"})
+_EGG_GIFTS = frozenset({"Wynaut", "Togepi"})
+_HATCHING_ABILITIES = frozenset({"Flame Body", "Magma Armor"})
+
+
+# `is_selectable()` is checked a lot while the player stands still, so the result of the last lookup
+# is kept around until the player moves, turns or changes maps.
+_last_player_position: tuple | None = None
+_last_targeted_encounter: tuple[MapFRLG | MapRSE, tuple[int, int], str] | None = None
+
 
 def _get_targeted_encounter() -> tuple[MapFRLG | MapRSE, tuple[int, int], str] | None:
-    if context.rom.is_frlg:
-        encounters = [
-            (MapFRLG.SILPH_CO_7F, (0, 7), "Lapras"),
-            (MapFRLG.SAFFRON_CITY_DOJO, (5, 3), "Hitmonlee"),
-            (MapFRLG.SAFFRON_CITY_DOJO, (7, 3), "Hitmonchan"),
-            (MapFRLG.CINNABAR_ISLAND_POKEMON_LAB_EXPERIMENT_ROOM, (11, 2), "Kanto Fossils"),
-            (MapFRLG.CINNABAR_ISLAND_POKEMON_LAB_EXPERIMENT_ROOM, (13, 4), "Kanto Fossils"),
-            (MapFRLG.CELADON_CITY_CONDOMINIUMS_ROOF_ROOM, (7, 3), "Eevee"),
-            (MapFRLG.ROUTE4_POKEMON_CENTER_1F, (1, 3), "Magikarp"),
-            (MapFRLG.FIVE_ISLAND_WATER_LABYRINTH, (14, 11), "Togepi"),
-        ]
-    else:
-        encounters = [
-            (MapRSE.ROUTE119_WEATHER_INSTITUTE_2F, (2, 2), "Castform"),
-            (MapRSE.ROUTE119_WEATHER_INSTITUTE_2F, (18, 6), "Castform"),
-            (MapRSE.RUSTBORO_CITY_DEVON_CORP_2F, (14, 8), "Hoenn Fossils"),
-            (MapRSE.MOSSDEEP_CITY_STEVENS_HOUSE, (4, 3), "Beldum"),
-            (MapRSE.LAVARIDGE_TOWN, (4, 7), "Wynaut"),
-        ]
-
-    targeted_tile = get_player_avatar().map_location_in_front
-    return next(
-        (
-            entry
-            for entry in encounters
-            if entry[0] == (targeted_tile.map_group, targeted_tile.map_number)
-            and entry[1] == targeted_tile.local_position
-        ),
-        None,
+    global _last_player_position, _last_targeted_encounter
+
+    player_avatar = get_player_avatar()
+    player_position = (
+        context.rom.is_frlg,
+        player_avatar.map_group_and_number,
+        player_avatar.local_coordinates,
+        player_avatar.facing_direction,
     )
+    if player_position == _last_player_position:
+        return _last_targeted_encounter
+
+    targeted_tile = player_avatar.map_location_in_front
+    if targeted_tile is None:
+        encounter = None
+    else:
+        encounters = _FRLG_ENCOUNTERS if context.rom.is_frlg else _RSE_ENCOUNTERS
+        encounter = encounters.get((targeted_tile.map_group, targeted_tile.map_number, *targeted_tile.local_position))
+
+    _last_player_position = player_position
+    _last_targeted_encounter = encounter
+    return encounter
 
 
 class StaticGiftResetsMode(BotMode):
@@ -95,7 +123,15 @@ class StaticGiftResetsMode(BotMode):
         if encounter[0] != (save_data.sections[1][4], save_data.sections[1][5]):
             raise BotModeError("The targeted encounter is not in the current map. Cannot soft reset.")
 
-        if encounter[2] == "Wynaut":
+        gift = encounter[2]
+        is_egg_gift = gift in _EGG_GIFTS
+        needs_confirmation = gift in _GIFTS_REQUIRING_CONFIRMATION
+        is_frlg = context.rom.is_frlg
+        is_emerald = context.rom.is_emerald
+        is_rs = context.rom.is_rs
+        saved_party = save_data.get_party()
+
+        if gift == "Wynaut":
             assert_registered_item(
                 ["Mach Bike"],
                 "You need to register the Mach Bike for the Select button, then save again.",
@@ -103,15 +139,12 @@ class StaticGiftResetsMode(BotMode):
             )
             if save_data.get_event_flag("RECEIVED_LAVARIDGE_EGG"):
                 raise BotModeError("You have already received the Wynaut egg in your saved game.")
-        if encounter[2] in ["Wynaut", "Togepi"] and save_data.get_party()[0].ability.name not in [
-            "Flame Body",
-            "Magma Armor",
-        ]:
+        if is_egg_gift and saved_party[0].ability.name not in _HATCHING_ABILITIES:
             console.print(
                 "[bold yellow]WARNING: First Pokemon in party does not have Flame Body / Magma Armor ability."
             )
             console.print("[bold yellow]This will slow down the egg hatching process.")
-        if encounter[2] == "Togepi":
+        if gift == "Togepi":
             if save_data.get_event_flag("GOT_TOGEPI_EGG"):
                 raise BotModeError("You have already received the Togepi egg in your saved game.")
             assert_registered_item(
@@ -119,7 +152,7 @@ class StaticGiftResetsMode(BotMode):
                 "You need to register the Bicycle for the Select button, then save again.",
                 check_in_saved_game=True,
             )
-            if save_data.get_party()[0].friendship < 255:
+            if saved_party[0].friendship < 255:
                 raise BotModeError(
                     "The first Pokémon in your party in the saved game must have max friendship (255) to receive the egg."
                 )
@@ -127,89 +160,86 @@ class StaticGiftResetsMode(BotMode):
         assert_empty_slot_in_party(
             "This mode requires at least one empty party slot, but your party is full.", check_in_saved_game=True
         )
+        party_size_before_gift = len(saved_party)
+
+        if is_egg_gift:
+            if gift == "Wynaut":
+                point_a = get_map_data(MapRSE.LAVARIDGE_TOWN, (2, 9))
+                point_b = get_map_data(MapRSE.LAVARIDGE_TOWN, (19, 10))
+            else:
+                point_a = get_map_data(MapFRLG.FIVE_ISLAND_WATER_LABYRINTH, (11, 9))
+                point_b = get_map_data(MapFRLG.FIVE_ISLAND_WATER_LABYRINTH, (17, 13))
+
+            def hatch_egg() -> Generator:
+                yield from navigate_to(point_a.map_group_and_number, point_a.local_position)
+                if not get_player_avatar().is_on_bike:
+                    context.emulator.press_button("Select")
+
+                # The route depends on where NPCs currently stand, so it has to be calculated after each reset.
+                path_to_point_a = calculate_path(point_b, point_a)
+                path_to_point_b = calculate_path(point_a, point_b)
+
+                def hatching_path():
+                    while not self._egg_has_hatched:
+                        yield from path_to_point_b
+                        yield from path_to_point_a
+
+                yield from follow_waypoints(hatching_path())
 
         while context.bot_mode != "Manual":
             yield from soft_reset(mash_random_keys=True)
             yield from wait_for_unique_rng_value()
 
             # Spam A through chat boxes
-            if context.rom.is_frlg:
+            if is_frlg:
                 yield from wait_until_task_is_active("Task_DrawFieldMessageBox", "A")
                 yield from wait_until_task_is_not_active("Task_DrawFieldMessageBox", "B")
-            if context.rom.is_emerald:
+            if is_emerald:
                 yield from wait_until_task_is_active("Task_DrawFieldMessage", "A")
                 yield from wait_until_task_is_not_active("Task_DrawFieldMessage", "B")
 
             # Accept the Pokémon
-            if encounter[2] in ["Beldum", "Hitmonchan", "Hitmonlee", "Magikarp", "Wynaut"]:
-                if context.rom.is_rse:
+            if needs_confirmation:
+                if not is_frlg:
                     yield from wait_for_task_to_start_and_finish("Task_HandleYesNoInput", "A")
                     yield from wait_for_task_to_start_and_finish("Task_Fanfare", "B")
-                if context.rom.is_frlg:
+                else:
                     yield from wait_for_task_to_start_and_finish("Task_YesNoMenu_HandleInput", "A")
                     yield from wait_for_task_to_start_and_finish("Task_Fanfare", "B")
                     yield from wait_for_task_to_start_and_finish("Task_DrawFieldMessageBox", "B")
-            if context.rom.is_rs and encounter[2] in ["Hoenn Fossils"]:
+            if is_rs and gift == "Hoenn Fossils":
                 yield from wait_until_event_flag_is_true("RECEIVED_FOSSIL_MON", "A")
 
             # Don't rename pokemon
-            if context.rom.is_frlg and encounter[2] not in ["Togepi"]:
-                if encounter[2] in ["Hitmonchan", "Hitmonlee"]:
+            if is_frlg and gift != "Togepi":
+                if gift in ("Hitmonchan", "Hitmonlee"):
                     yield from wait_until_event_flag_is_true("GOT_HITMON_FROM_DOJO", "B")
                 yield from wait_for_task_to_start_and_finish("Task_YesNoMenu_HandleInput", "B")
-            elif context.rom.is_frlg and encounter[2] in ["Togepi"]:
+            elif is_frlg:
                 yield from wait_until_event_flag_is_true("GOT_TOGEPI_EGG", "B")
                 yield from wait_for_script_to_start_and_finish("Std_MsgboxDefault", "B")
-            if context.rom.is_emerald and encounter[2] not in ["Wynaut"]:
+            if is_emerald and gift != "Wynaut":
                 yield from wait_for_task_to_start_and_finish("Task_DrawFieldMessage", "B")
                 yield from wait_for_task_to_start_and_finish("Task_HandleYesNoInput", "B")
-            if context.rom.is_rs and encounter[2] in ["Hoenn Fossils"]:
+            if is_rs and gift == "Hoenn Fossils":
                 yield from wait_for_task_to_start_and_finish("Task_HandleYesNoInput", "B")
 
             # Extra check for lapras and castform and clear extra message boxes
-            if encounter[2] == "Lapras":
+            if gift == "Lapras":
                 yield from wait_until_event_flag_is_true("GOT_LAPRAS_FROM_SILPH", "B")
-            if encounter[2] == "Castform":
+            if gift == "Castform":
                 yield from wait_until_event_flag_is_true("RECEIVED_CASTFORM", "B")
 
-            def egg_in_party() -> int:
-                total_eggs = 0
-                for pokemon in get_party():
-                    if pokemon.is_egg:
-                        total_eggs += 1
-                return total_eggs
-
-            def hatch_egg() -> Generator:
-                if encounter[2] == "Wynaut":
-                    point_a = get_map_data(MapRSE.LAVARIDGE_TOWN, (2, 9))
-                    point_b = get_map_data(MapRSE.LAVARIDGE_TOWN, (19, 10))
-                elif encounter[2] == "Togepi":
-                    point_a = get_map_data(MapFRLG.FIVE_ISLAND_WATER_LABYRINTH, (11, 9))
-                    point_b = get_map_data(MapFRLG.FIVE_ISLAND_WATER_LABYRINTH, (17, 13))
-                else:
-                    raise BotModeError("Unknown encounter type")
-
-                yield from navigate_to(point_a.map_group_and_number, point_a.local_position)
-                if not get_player_avatar().is_on_bike:
-                    context.emulator.press_button("Select")
-
-                def hatching_path():
-                    path_to_point_a = calculate_path(point_b, point_a)
-                    path_to_point_b = calculate_path(point_a, point_b)
-                    while not self._egg_has_hatched:
-                        yield from path_to_point_b
-                        yield from path_to_point_a
-
-                yield from follow_waypoints(hatching_path())
-
-            if encounter[2] in ["Wynaut", "Togepi"]:
+            if is_egg_gift:
                 yield from wait_until_task_is_not_active("Task_Fanfare", "B")
-                while egg_in_party() == 0:
+                # Only the party size needs to be checked here, as the egg is the only thing that can
+                # fill the empty slot. This avoids decoding the whole party every frame.
+                while get_party_size() == party_size_before_gift:
                     context.emulator.press_button("B")
                     yield
-                while egg_in_party() > 0:
+                self._egg_has_hatched = False
+                while not self._egg_has_hatched:
                     yield from wait_for_player_avatar_to_be_controllable()
-                    self._egg_has_hatched = False
                     yield from hatch_egg()
 
             # Navigate to the summary screen to check for shininess
@@ -1421,6 +1421,15 @@ def get_eggs_in_party() -> int:
     return sum(bool(pokemon.is_egg) for pokemon in get_party())
 
 
+def get_party_size() -> int:
+    """
+    Reads the number of Pokémon in the trainer's party without decoding any of them.
+
+    :return: Number of occupied party slots (0-6)
+    """
+    return read_symbol("gPlayerPartyCount", size=1)[0]
+
+
 def get_party() -> list[Pokemon]:
     """
     Checks how many Pokémon are in the trainer's party, decodes and returns them all.
@@ -1431,7 +1440,7 @@ def get_party() -> list[Pokemon]:
         return state_cache.party.value
 
     party = []
-    party_count = read_symbol("gPlayerPartyCount", size=1)[0]
+    party_count = get_party_size()
     for p in range(party_count):
         o = p * 100
         mon = parse_pokemon(read_symbol("gPlayerParty", o, 100))
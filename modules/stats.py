@@ -347,7 +347,7 @@ class TotalStats:
     def log_encounter(
         self,
         pokemon: Pokemon,
-        block_list: list,
+        block_list: frozenset[str],
         custom_filter_result: str | bool,
         gif_path: Path | None = None,
         tcg_path: Path | None = None,
@@ -405,7 +405,7 @@ class TotalStats:
             hook = (
                 Pokemon(pokemon.data),
                 copy.deepcopy(self.total_stats),
-                copy.deepcopy(block_list),
+                sorted(block_list),
                 copy.deepcopy(custom_filter_result),
                 copy.deepcopy(gif_path),
                 copy.deepcopy(tcg_path),